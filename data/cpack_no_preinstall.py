@@ -3,25 +3,56 @@
 # Copyright 2025, Andrew D Smith
 # SPDX-License-Identifier: MIT
 
+import mmap
 import sys
 
+PREINSTALL = b"preinstall:"
+
+
+def find_preinstall_rule(data):
+    """
+    Get the offsets of the start of the 'preinstall:' rule line and the end
+    of the recipe line that follows it, or None if there is no such rule. A
+    line without a trailing newline ends at the end of the data.
+    """
+    if data[: len(PREINSTALL)] == PREINSTALL:
+        start = 0
+    else:
+        start = data.find(b"\n" + PREINSTALL) + 1
+        if start == 0:
+            return None
+    rule_end = data.find(b"\n", start)
+    if rule_end < 0:
+        return start, len(data)
+    recipe_end = data.find(b"\n", rule_end + 1)
+    if recipe_end < 0:
+        return start, len(data)
+    return start, recipe_end + 1
+
+
 if len(sys.argv) != 2:
     print("Usage: cpack_no_preinstall.py path/to/makefile", file=sys.stderr)
     sys.exit(1)
 
-found_preinstall = False
-prev_was_preinstall = False
-for line in open(sys.argv[1]):
-    if line.startswith("preinstall:"):
-        print("preinstall:")
-        prev_was_preinstall = True
-        found_preinstall = True
-    elif prev_was_preinstall:
-        print("#")
-        prev_was_preinstall = False
-    else:
-        print(line, end="")
+try:
+    with open(sys.argv[1], "rb") as f:
+        # mmap can't map an empty file, and there is nothing to find in one
+        if f.seek(0, 2) == 0:
+            data = b""
+        else:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+except FileNotFoundError as err:
+    print(f"Makefile not found: {err.filename}", file=sys.stderr)
+    sys.exit(1)
 
-if not found_preinstall:
+rule = find_preinstall_rule(data)
+if rule is None:
     print("Failed to find preinstall target", file=sys.stderr)
     sys.exit(1)
+
+start, stop = rule
+write = sys.stdout.buffer.write
+write(data[:start])
+write(b"preinstall:\n#\n")
+write(data[stop:])
+sys.stdout.buffer.flush()
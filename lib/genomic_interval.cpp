@@ -33,7 +33,9 @@
 #include <fstream>
 #include <iterator>  // for std::cend
 #include <ranges>
+#include <sstream>
 #include <string>
+#include <string_view>
 #include <unordered_map>
 #include <utility>  // for std::move, std::pair
 #include <vector>
@@ -41,7 +43,7 @@
 namespace transferase {
 
 [[nodiscard]] STATIC auto
-parse(const genome_index_metadata &meta, const std::string &line,
+parse(const genome_index_metadata &meta, const std::string_view line,
       std::error_code &ec) noexcept -> genomic_interval {
   // NOLINTBEGIN(cppcoreguidelines-pro-bounds-pointer-arithmetic)
 
@@ -51,7 +53,7 @@ parse(const genome_index_metadata &meta, const std::string &line,
 
   // Parse chromosome name
   auto first_space_pos = line.find_first_of(" \t");
-  if (first_space_pos == std::string::npos) {
+  if (first_space_pos == std::string_view::npos) {
     ec = genomic_interval_error_code::error_parsing_bed_line;
     first_space_pos = line_sz;
   }
@@ -97,14 +99,30 @@ genomic_interval::read(const genome_index &index, const std::string &filename,
     ec = std::make_error_code(std::errc(errno));
     return {};
   }
+  // Read the whole file at once and parse lines as views into the buffer;
+  // reading to the end, rather than by the file size, works for pipes
+  std::ostringstream contents;
+  contents << in.rdbuf();
+  if (in.bad()) {
+    ec = std::make_error_code(std::errc::io_error);
+    return {};
+  }
+  const std::string buf = std::move(contents).str();
 
   std::vector<genomic_interval> v;
-  std::string line;
-  while (getline(in, line)) {
+  v.reserve(std::ranges::count(buf, '\n') + 1);
+  const std::string_view data{buf};
+  std::size_t line_start = 0;
+  while (line_start < std::size(data)) {
+    auto line_stop = data.find('\n', line_start);
+    if (line_stop == std::string_view::npos)
+      line_stop = std::size(data);
+    const auto line = data.substr(line_start, line_stop - line_start);
     const auto gi = parse(meta, line, ec);
     if (ec)
       return {};
     v.push_back(gi);
+    line_start = line_stop + 1;
   }
   return v;
 }
@@ -30,7 +30,7 @@
 #define STATIC static
 #endif
 
-#include <string>
+#include <string_view>
 #include <system_error>
 
 namespace transferase {
@@ -39,7 +39,7 @@ struct genomic_interval;
 struct genome_index_metadata;
 
 [[nodiscard]] STATIC auto
-parse(const genome_index_metadata &meta, const std::string &line,
+parse(const genome_index_metadata &meta, const std::string_view line,
       std::error_code &ec) noexcept -> genomic_interval;
 
 }  // namespace transferase
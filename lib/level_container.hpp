@@ -89,12 +89,19 @@ template <typename level_element_type> struct level_container {
     -> const level_element_type& {return v[pos];}
   // clang-format on
 
+  /// @brief Write the weighted mean for each element, or -1 if there are
+  /// fewer than min_reads reads, to a buffer of at least size() values.
+  auto
+  get_wmeans(const std::uint32_t min_reads, float *out) const noexcept -> void {
+    std::ranges::transform(v, out, [&](const auto &x) -> float {
+      return x.n_reads() >= min_reads ? x.get_wmean() : -1.0f;
+    });
+  }
+
   [[nodiscard]] auto
   get_wmeans(const std::uint32_t min_reads) const -> std::vector<float> {
     std::vector<float> u(n_rows * n_cols);
-    std::ranges::transform(v, std::begin(u), [&](const auto &x) -> float {
-      return x.n_reads() >= min_reads ? x.get_wmean() : -1.0f;
-    });
+    get_wmeans(min_reads, std::data(u));
     return u;
   }
 
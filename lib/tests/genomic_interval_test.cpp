@@ -29,8 +29,15 @@
 
 #include <gtest/gtest.h>
 
+#include <sys/stat.h>  // for mkfifo
+#include <unistd.h>    // for getpid
+
+#include <filesystem>
+#include <format>
+#include <fstream>
 #include <iterator>
 #include <string>
+#include <thread>
 #include <unordered_map>
 
 using namespace transferase;  // NOLINT
@@ -68,6 +75,27 @@ TEST_F(genomic_interval_read_valid, basic_assertions) {
   EXPECT_EQ(intervals[0], expected_first_interval);
 }
 
+TEST_F(genomic_interval_read_valid, read_from_fifo) {
+  // A FIFO has no file size, so the intervals must be read to the end
+  std::error_code ec;
+  const auto index = genome_index::read(index_dir, genome_name, ec);
+  EXPECT_FALSE(ec);
+  const auto fifo = std::filesystem::temp_directory_path() /
+                    std::format("genomic_interval_test_{}.fifo", getpid());
+  ASSERT_EQ(mkfifo(fifo.c_str(), 0600), 0);
+  std::jthread writer([&] {
+    std::ifstream in{intervals_file};
+    std::ofstream out{fifo};
+    out << in.rdbuf();
+  });
+  const auto intervals = genomic_interval::read(index, fifo.string(), ec);
+  writer.join();
+  std::filesystem::remove(fifo);
+  EXPECT_FALSE(ec);
+  EXPECT_EQ(std::size(intervals), expected_intervals_size);
+  EXPECT_EQ(intervals[0], expected_first_interval);
+}
+
 // Test cases
 TEST(genomic_interval_test, valid_input) {
   // NOLINTBEGIN(cppcoreguidelines-avoid-magic-numbers)
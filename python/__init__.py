@@ -7,6 +7,49 @@ within this package:
   >>> help(pyxfr_utils)
 """
 
-from .pyxfr import *
+import importlib
 
-from .pyxfr_utils import generate_bins, load_methbase_metadata
+# Names provided by pyxfr_utils; everything else comes from the bindings
+_utils_names = (
+    "generate_bins",
+    "generate_bins_array",
+    "load_methbase_metadata",
+)
+
+# Submodules of the package, imported when first accessed as attributes
+_submodule_names = ("pyxfr", "pyxfr_utils")
+
+
+def _public_names(module):
+    return [name for name in dir(module) if not name.startswith("_")]
+
+
+def __getattr__(name):
+    """
+    Import the bindings and utilities on first use rather than when the
+    package is imported; found attributes are cached in the package.
+    """
+    if name == "__all__":
+        core = importlib.import_module(".pyxfr", __name__)
+        value = _public_names(core) + list(_utils_names)
+    elif name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    elif name in _submodule_names:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        if name in _utils_names:
+            module = importlib.import_module(".pyxfr_utils", __name__)
+        else:
+            module = importlib.import_module(".pyxfr", __name__)
+        try:
+            value = getattr(module, name)
+        except AttributeError:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__getattr__("__all__")))
@@ -23,29 +23,161 @@
 """
 Get the platform tag most appropriate for the given wheel file.
 """
-import sys, os, errno, platform, subprocess, re
+import sys, os, errno, platform, subprocess, re, functools, json, fcntl
+import collections, shutil, tempfile, zipfile
 
-def get_platform_tags_linux(whl_file):
+# Tags for wheels that were already analyzed, keyed by path, size and mtime
+TAG_CACHE_FILE = os.path.expanduser(
+    os.environ.get("TRANSFERASE_TAG_CACHE", "~/.cache/transferase/tags.json")
+)
+# The constraining tag in the 'auditwheel show' output
+SYM_TAG_PATTERN = re.compile(
+    r'This constrains the platform tag to "([a-zA-Z0-9_]*)"'
+)
+# The 'minos' field in the 'vtool -show-build' output
+MINOS_PATTERN = re.compile(r"^\s*minos\s+(\S+)", re.M | re.ASCII)
+
+
+@functools.lru_cache(maxsize=None)
+def get_wheel_policies():
+    """
+    Load the auditwheel policies once; parsing the policy JSON dominates the
+    time to analyze a single wheel.
+    """
+    from auditwheel.policy import WheelPolicies
+
+    return WheelPolicies()
+
+
+def get_sym_tag_single_so(whl_file):
+    """
+    If the wheel holds exactly one shared library, and that library needs no
+    external libraries beyond the policy whitelists, the tag depends only on
+    its versioned symbols. Get it from that one file without unpacking and
+    walking the whole wheel. Returns None if this shortcut doesn't apply, or
+    if the auditwheel internals it uses differ, as they do in auditwheel 6.3
+    and newer.
+    """
+    try:
+        from auditwheel.elfutils import elf_find_versioned_symbols
+        from auditwheel.lddtree import lddtree
+        from auditwheel.wheel_abi import get_external_libs
+        from elftools.elf.elffile import ELFFile
+    except ImportError:
+        return None
+
+    with zipfile.ZipFile(whl_file) as whl:
+        so_names = [n for n in whl.namelist() if n.endswith(".so")]
+        if len(so_names) != 1:
+            return None
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            so_file = whl.extract(so_names[0], tmp_dir)
+            try:
+                wheel_policies = get_wheel_policies()
+                external_refs = wheel_policies.lddtree_external_references(
+                    lddtree(so_file), tmp_dir
+                )
+                if get_external_libs(external_refs):
+                    return None
+            except (ImportError, TypeError, AttributeError):
+                return None
+            versioned_symbols = collections.defaultdict(set)
+            with open(so_file, "rb") as f:
+                for key, value in elf_find_versioned_symbols(ELFFile(f)):
+                    versioned_symbols[key].add(value)
+    return wheel_policies.get_policy_name(
+        wheel_policies.versioned_symbols_policy(versioned_symbols)
+    )
+
+
+def get_sym_tag(whl_file):
+    """
+    Analyze the wheel with auditwheel and get the tag that constrains it.
     """
-    For the given wheel file, get the 'overall_tag' that is deemed
-    most appropriate by the functions in the auditwheel package
+    sym_tag = get_sym_tag_single_so(whl_file)
+    if sym_tag:
+        return sym_tag
+
+    # The auditwheel internals used here changed in auditwheel 6.3; for
+    # newer versions use the 'auditwheel show' command line tool
+    try:
+        from auditwheel.wheel_abi import analyze_wheel_abi
+
+        winfo = analyze_wheel_abi(get_wheel_policies(), whl_file, frozenset())
+    except (ImportError, TypeError, AttributeError):
+        return get_sym_tag_auditwheel_show(whl_file)
+    # ADS: This is the tag in the part of the 'auditwheel show' output that
+    # is below all the dependencies and seems to be more specific; the
+    # 'overall_tag' didn't always give the right tag
+    return winfo.sym_tag
+
+
+def get_sym_tag_auditwheel_show(whl_file):
     """
-    cmd = f"auditwheel show {whl_file}"
+    Get the tag that constrains the wheel from the 'auditwheel show' output,
+    or None if it isn't found or auditwheel isn't installed.
+    """
+    auditwheel = find_tool("auditwheel")
+    if not auditwheel:
+        return None
     p = subprocess.run(
-        cmd,
+        [auditwheel, "show", whl_file],
         capture_output=True,
-        shell=True,
         check=False,
+        text=True,
     )
-    text = p.stdout.decode().strip().replace("\n", " ").replace("  ", " ")
-    # ADS: Updated match here grabs the part of the auditwheel output that is
-    # below all the dependencies and seems to be more specific.
-    tag_match = re.search(
-        'This constrains the platform tag to "([a-zA-Z0-9_]*)"', text
-    )
-    # ADS: previous pattern below didn't always grab the right tag
-    # tag_match = re.search('tag: "([a-zA-Z0-9_]*)"', text)
-    return tag_match.group(1) if tag_match and tag_match.groups() else None
+    text = p.stdout.strip().replace("\n", " ").replace("  ", " ")
+    tag_match = SYM_TAG_PATTERN.search(text)
+    return tag_match.group(1) if tag_match else None
+
+
+def load_tag_cache():
+    """
+    Load the cache of platform tags, or an empty cache if the file doesn't
+    exist or can't be parsed.
+    """
+    try:
+        with open(TAG_CACHE_FILE) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_to_tag_cache(key, tag):
+    """
+    Add one tag to the cache file. The lock serializes parallel build steps
+    and the rename means readers never see a partially written file. Any
+    failure leaves the cache as it was.
+    """
+    try:
+        os.makedirs(os.path.dirname(TAG_CACHE_FILE), exist_ok=True)
+        with open(f"{TAG_CACHE_FILE}.lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            cache = load_tag_cache()
+            cache[key] = tag
+            tmp_filename = f"{TAG_CACHE_FILE}.{os.getpid()}.tmp"
+            with open(tmp_filename, "w") as f:
+                json.dump(cache, f)
+            os.replace(tmp_filename, TAG_CACHE_FILE)
+    except OSError:
+        pass
+
+
+def get_platform_tags_linux(whl_file, st):
+    """
+    For the given wheel file, get the 'sym_tag' (the tag constrained by the
+    versioned symbols) that is deemed most appropriate by the functions in
+    the auditwheel package. The 'st' is the result of os.stat for the wheel
+    file.
+    """
+    key = f"{os.path.abspath(whl_file)}:{st.st_size}:{st.st_mtime_ns}"
+    tag = load_tag_cache().get(key)
+    if tag is None:
+        tag = get_sym_tag(whl_file)
+        if tag:
+            save_to_tag_cache(key, tag)
+    return tag
 
 
 def get_platform_tags_macos(whl_file):
@@ -54,72 +186,112 @@ def get_platform_tags_macos(whl_file):
     module that comes first in the list, and so is the most specific
     that is compatible with the build system
     """
+    version = platform.mac_ver()[0].split(".")
+    # "10.16" is what older Pythons see from macOS 11+ in compatibility
+    # mode; packaging knows how to ask for the real version
+    if len(version) >= 2 and version[:2] != ["10", "16"]:
+        try:
+            major, minor = int(version[0]), int(version[1])
+        except ValueError:
+            pass
+        else:
+            # Since macOS 11 only the major version is used in the tag
+            minor = 0 if major >= 11 else minor
+            return f"macosx_{major}_{minor}_{platform.machine()}"
+
     import packaging.tags
     return next(packaging.tags.platform_tags())
 
 
+@functools.lru_cache(maxsize=None)
+def find_tool(name):
+    """
+    Get the full path to a command line tool, searching PATH only once per
+    tool, or None if the tool isn't found.
+    """
+    return shutil.which(name)
+
+
 def get_platform_tags_from_so_macos(so_file):
     """
     For the given shared library file, get the platform tag from the packaging
     module that comes first in the list, and so is the most specific that is
     compatible with the build system
     """
+    lipo, vtool = find_tool("lipo"), find_tool("vtool")
+    if not lipo or not vtool:
+        return None
+
     # get the architecture
-    arch_cmd = f"lipo -archs {so_file}"
     p = subprocess.run(
-        arch_cmd,
+        [lipo, "-archs", so_file],
         capture_output=True,
-        shell=True,
         check=False,
+        text=True,
     )
-    arch = p.stdout.decode().strip()
-
-    # plat_cmd = f"vtool -show-build {so_file} | grep platform"
-    # p = subprocess.run(
-    #     plat_cmd,
-    #     capture_output=True,
-    #     shell=True,
-    #     check=False,
-    # )
-    # plat = p.stdout.decode().strip().split()[-1]
-    # plat = plat.lower()
+    arch = p.stdout.strip()
+
+    # The platform is also in the 'vtool -show-build' output, but the tag
+    # always needs 'macosx' here
     plat = "macosx"
 
-    minos_cmd = f"vtool -show-build {so_file} | grep minos"
     p = subprocess.run(
-        minos_cmd,
+        [vtool, "-show-build", so_file],
         capture_output=True,
-        shell=True,
         check=False,
+        text=True,
     )
-    minos = p.stdout.decode().strip().split()[-1]
-    minos = minos.replace(".", "_")
+    minos = MINOS_PATTERN.findall(p.stdout)
+    if not minos:
+        return None
+    minos = minos[-1].replace(".", "_")
 
     return f"{plat}_{minos}_{arch}"
 
 
-if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Give exactly one arg to get_platform_tags", file=sys.stderr)
-        sys.exit(-1)
-    if not os.path.exists(sys.argv[1]):
-        print(f"wheel file not found {sys.argv[1]}", file=sys.stderr)
-        sys.exit(-1)
-    the_tag = None
+def get_platform_tag(filename, st):
+    """
+    Get the platform tag for one wheel file (or shared library file on
+    macOS), or None if it can't be determined. The 'st' is the result of
+    os.stat for the file.
+    """
     if platform.system() == "Linux":
-        the_tag = get_platform_tags_linux(sys.argv[1])
-    elif platform.system() == "Darwin":
-        if sys.argv[1].endswith(".whl"):
-            the_tag = get_platform_tags_macos(sys.argv[1])
-        elif sys.argv[1].endswith(".so"):
-            the_tag = get_platform_tags_from_so_macos(sys.argv[1])
-        else:
-            print("Invalid file type (not .so or .whl)")
-            sys.exit(-1)
-    else:
-        print(f"System not currently supported: {platform.system()}")
+        return get_platform_tags_linux(filename, st)
+    if platform.system() == "Darwin":
+        if filename.endswith(".whl"):
+            return get_platform_tags_macos(filename)
+        if filename.endswith(".so"):
+            return get_platform_tags_from_so_macos(filename)
+        print("Invalid file type (not .so or .whl)")
         sys.exit(-1)
-    if not the_tag:
-        print("Failed to get platform tag")
+    print(f"System not currently supported: {platform.system()}")
+    sys.exit(-1)
+
+
+def main(filenames):
+    """
+    Print the platform tag for each given file, one per line, so a single
+    process can handle several wheels.
+    """
+    the_tags = []
+    for filename in filenames:
+        try:
+            st = os.stat(filename)
+        except FileNotFoundError:
+            print(f"wheel file not found {filename}", file=sys.stderr)
+            sys.exit(-1)
+        the_tag = get_platform_tag(filename, st)
+        if not the_tag:
+            print("Failed to get platform tag")
+            sys.exit(-1)
+        the_tags.append(the_tag)
+    sys.stdout.write("\n".join(the_tags))
+    sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Give at least one arg to get_platform_tags", file=sys.stderr)
         sys.exit(-1)
-    print(the_tag, end="")
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    main(sys.argv[1:])
@@ -28,15 +28,70 @@
 
 #include <listobject.h>  // for PyList_New
 #include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>     // IWYU pragma: keep
 #include <nanobind/stl/string.h>  // IWYU pragma: keep
+#include <nanobind/stl/tuple.h>   // IWYU pragma: keep
 #include <nanobind/stl/vector.h>  // IWYU pragma: keep
 
-#include <new>  // for operator new
+#include <algorithm>  // for std::min
+#include <cstddef>    // for std::size_t
+#include <cstdint>
+#include <memory>  // for std::unique_ptr
+#include <new>     // for operator new
+#include <stdexcept>
 #include <string>
+#include <tuple>
 #include <type_traits>  // for std::is_lvalue_reference_v, std::is_r...
 #include <utility>      // for std::declval
 #include <vector>
 
+namespace transferase {
+
+template <typename T>
+using bins_nparray = nanobind::ndarray<T, nanobind::numpy, nanobind::shape<-1>>;
+
+template <typename T>
+[[nodiscard]] auto
+make_bins_nparray(std::unique_ptr<T[]> data, const std::size_t n) {
+  // The returned array owns the buffer through the capsule
+  T *ptr = data.release();
+  const nanobind::capsule owner(
+    ptr, [](void *p) noexcept { delete[] static_cast<T *>(p); });
+  return bins_nparray<T>(ptr, {n}, owner);
+}
+
+[[nodiscard]] inline auto
+genome_index_get_bins(const genome_index &self, const std::uint32_t bin_size)
+  -> std::tuple<bins_nparray<std::int32_t>, bins_nparray<std::int64_t>,
+                bins_nparray<std::int64_t>> {
+  if (bin_size == 0)
+    throw std::invalid_argument("bin_size must be positive");
+  // Counted here in 64 bits: get_n_bins uses 32 bits, and wraps for bin
+  // sizes near the largest uint32 value
+  std::size_t n_bins = 0;
+  for (const std::int64_t chrom_size : self.meta.chrom_size)
+    n_bins += (chrom_size + bin_size - 1) / bin_size;
+  std::unique_ptr<std::int32_t[]> chrom_ids(new std::int32_t[n_bins]);
+  std::unique_ptr<std::int64_t[]> starts(new std::int64_t[n_bins]);
+  std::unique_ptr<std::int64_t[]> stops(new std::int64_t[n_bins]);
+  std::size_t i = 0;
+  std::int32_t ch_id = 0;
+  for (const std::int64_t chrom_size : self.meta.chrom_size) {
+    for (std::int64_t start = 0; start < chrom_size; start += bin_size) {
+      chrom_ids[i] = ch_id;
+      starts[i] = start;
+      stops[i] = std::min(start + bin_size, chrom_size);
+      ++i;
+    }
+    ++ch_id;
+  }
+  return {make_bins_nparray(std::move(chrom_ids), n_bins),
+          make_bins_nparray(std::move(starts), n_bins),
+          make_bins_nparray(std::move(stops), n_bins)};
+}
+
+}  // namespace transferase
+
 auto
 genome_index_bindings(nanobind::class_<transferase::genome_index> &cls)
   -> void {
@@ -47,6 +102,18 @@ genome_index_bindings(nanobind::class_<transferase::genome_index> &cls)
   cls.def("is_consistent", &xfr::genome_index::is_consistent);
   cls.def("__hash__", &xfr::genome_index::get_hash);
   cls.def("__repr__", &xfr::genome_index::tostring);
+  cls.def_prop_ro(
+    "chrom_names",
+    [](const xfr::genome_index &self) { return self.meta.chrom_order; },
+    R"doc(
+    List of chromosome names, in the order used by this GenomeIndex.
+    )doc");
+  cls.def_prop_ro(
+    "chrom_sizes",
+    [](const xfr::genome_index &self) { return self.meta.chrom_size; },
+    R"doc(
+    List of chromosome sizes, in the same order as chrom_names.
+    )doc");
   cls.def_static("read",
                  nb::overload_cast<const std::string &, const std::string &>(
                    &xfr::genome_index::read),
@@ -139,6 +206,20 @@ genome_index_bindings(nanobind::class_<transferase::genome_index> &cls)
         base-pairs.
     )doc",
           "window_size"_a, "window_step"_a);
+  cls.def("get_bins", &xfr::genome_index_get_bins,
+          R"doc(
+    Get the genomic bins of the given size as three numpy arrays, with one
+    entry for each bin, in the same order as the bins for queries by bin
+    size. The arrays are the index of each bin's chromosome in chrom_names
+    (int32), and the start and stop positions of each bin (int64). The final
+    bin in each chromosome is typically not the entire bin size.
+
+    Parameters
+    ----------
+
+    bin_size (int): The size of the bins.
+    )doc",
+          "bin_size"_a);
   cls.def_static("make_genome_index",
                  nb::overload_cast<const std::string &>(
                    &xfr::genome_index::make_genome_index),
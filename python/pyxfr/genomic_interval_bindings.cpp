@@ -53,6 +53,28 @@ genomic_interval_read(const genome_index &index, const std::string &filename)
   return genomic_interval::read(index, filename);
 }
 
+[[nodiscard]] inline auto
+genomic_interval_to_string(const genomic_interval &self,
+                           const genome_index &index) -> nb::str {
+  const auto n_chroms = std::ssize(index.meta.chrom_order);
+  if (self.ch_id >= n_chroms)
+    throw std::out_of_range(std::format(
+      "Index out of range: ch_id={}, n_chroms={}", self.ch_id, n_chroms));
+  const nb::tuple t =
+    nb::make_tuple(index.meta.chrom_order[self.ch_id], self.start, self.stop);
+  return nb::repr(t);
+}
+
+[[nodiscard]] inline auto
+genomic_interval_to_strings(const genome_index &index,
+                            const std::vector<genomic_interval> &intervals)
+  -> nb::list {
+  nb::list strings;
+  for (const auto &interval : intervals)
+    strings.append(genomic_interval_to_string(interval, index));
+  return strings;
+}
+
 }  // namespace transferase
 
 auto
@@ -88,19 +110,8 @@ genomic_interval_bindings(nanobind::class_<transferase::genomic_interval> &cls)
       R"doc(
     Print a genomic interval with the numeric code for chromosome name.
       )doc")
-    .def(
-      "to_string",
-      [](const transferase::genomic_interval &self,
-         const transferase::genome_index &index) {
-        const auto n_chroms = std::ssize(index.meta.chrom_order);
-        if (self.ch_id >= n_chroms)
-          throw std::out_of_range(std::format(
-            "Index out of range: ch_id={}, n_chroms={}", self.ch_id, n_chroms));
-        const nb::tuple t = nb::make_tuple(index.meta.chrom_order[self.ch_id],
-                                           self.start, self.stop);
-        return nb::repr(t);
-      },
-      R"doc(
+    .def("to_string", &transferase::genomic_interval_to_string,
+         R"doc(
     Print a genomic interval with name of chromosome.
 
     Parameters
@@ -108,7 +119,20 @@ genomic_interval_bindings(nanobind::class_<transferase::genomic_interval> &cls)
 
     genome_index (GenomeIndex): Must correspond to the appropriate genome.
     )doc",
-      "genome_index"_a)  // static functions of genomic_interval class
+         "genome_index"_a)  // static functions of genomic_interval class
+    .def_static("to_strings", &transferase::genomic_interval_to_strings,
+                R"doc(
+    Format a list of genomic intervals with names of chromosomes, giving the
+    same strings as calling to_string() on each interval, in a single call.
+
+    Parameters
+    ----------
+
+    genome_index (GenomeIndex): Must correspond to the appropriate genome.
+
+    intervals (list[GenomicInterval]): The intervals to format.
+    )doc",
+                "genome_index"_a, "intervals"_a)
     .def_static("read", &transferase::genomic_interval_read,
                 R"doc(
     Read a BED file of genomic intervals.
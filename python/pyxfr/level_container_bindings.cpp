@@ -47,6 +47,36 @@
 
 namespace nb = nanobind;
 
+namespace transferase {
+
+using wmeans_nparray = nb::ndarray<float, nb::numpy, nb::shape<-1, -1>,
+                                   nb::c_contig, nb::device::cpu>;
+
+template <typename level_container>
+[[nodiscard]] auto
+all_wmeans(const level_container &self, const std::uint32_t min_reads) {
+  // The returned array owns the buffer through the capsule
+  auto *data = new float[std::size(self)];
+  self.get_wmeans(min_reads, data);
+  const nb::capsule owner(
+    data, [](void *p) noexcept { delete[] static_cast<float *>(p); });
+  return wmeans_nparray(data, {self.n_cols, self.n_rows}, owner);
+}
+
+template <typename level_container>
+[[nodiscard]] auto
+all_wmeans_out(const level_container &self, const std::uint32_t min_reads,
+               wmeans_nparray out) -> wmeans_nparray {
+  if (out.shape(0) != self.n_cols || out.shape(1) != self.n_rows)
+    throw std::invalid_argument(
+      std::format("Output shape must be ({}, {}), got ({}, {})", self.n_cols,
+                  self.n_rows, out.shape(0), out.shape(1)));
+  self.get_wmeans(min_reads, out.data());
+  return out;
+}
+
+}  // namespace transferase
+
 auto
 level_container_bindings(
   nb::class_<transferase::level_container<transferase::level_element_t>> &cls)
@@ -155,19 +185,11 @@ level_container_bindings(
     arg1 (int): The index of the methylome for which to get the weighted mean
         methylation level.
     )doc");
-  cls.def(
-    "all_wmeans",
-    [](const level_container &self, const std::uint32_t min_reads) {
-      using nparray =
-        nb::ndarray<float, nb::numpy, nb::shape<-1, -1, 2>, nb::c_contig>;
-      auto m = self.get_wmeans(min_reads);
-      return nparray(m.data(), {self.n_cols, self.n_rows, 2}).cast();
-    },
-    nb::rv_policy::reference_internal,
-    R"doc(
+  cls.def("all_wmeans", &transferase::all_wmeans<level_container>, R"doc(
     Apply the 'get_wmean' function to all elements of this MLevels object,
-    returning a list of weighted mean methylation levels. A value of -1.0
-    means insufficient reads, but by default the minimium required reads is 0.
+    returning a numpy array of weighted mean methylation levels with shape
+    (n_methylomes, n_intervals). A value of -1.0 means insufficient reads, but
+    by default the minimium required reads is 0.
 
     Parameters
     ----------
@@ -177,7 +199,23 @@ level_container_bindings(
         intervals with no reads will result in a level of 0.0, which might be
         desired depending on your application.
     )doc",
-    "min_reads"_a = 0u);
+          "min_reads"_a = 0u);
+  cls.def("all_wmeans", &transferase::all_wmeans_out<level_container>,
+          R"doc(
+    Like all_wmeans(min_reads), but writes the weighted means into 'out' and
+    returns it, so the same array can be reused across calls.
+
+    Parameters
+    ----------
+
+    min_reads (int): The minimum number of reads below which the value will be
+        given the value -1.0.
+
+    out (numpy.ndarray): A C-contiguous float32 array with shape
+        (n_methylomes, n_intervals). Other arrays are not converted, and
+        raise a TypeError.
+    )doc",
+          "min_reads"_a, "out"_a.noconvert());
   cls.def("__str__", [](const level_container &self) -> std::string {
     return std::format("MLevels size={}", std::size(self));
   });
@@ -322,20 +360,11 @@ level_container_covered_bindings(
     arg1 (int): The index of the methylome for which to get the weighted mean
         methylation level.
     )doc");
-  cls.def(
-    "all_wmeans",
-    [](const level_container &self, const std::uint32_t min_reads) {
-      using nparray =
-        nb::ndarray<float, nb::numpy, nb::shape<-1, -1, 2>, nb::c_contig>;
-      auto m = self.get_wmeans(min_reads);
-      return nparray(m.data(), {self.n_cols, self.n_rows, 2}).cast();
-    },
-    nb::rv_policy::reference_internal,
-    R"doc(
+  cls.def("all_wmeans", &transferase::all_wmeans<level_container>, R"doc(
     Apply the 'get_wmean' function to all elements of this MLevelsCovered
-    object, returning a list of weighted mean methylation levels. A value of
-    -1.0 means insufficient reads, but by default the minimium required reads
-    is 0.
+    object, returning a numpy array of weighted mean methylation levels with
+    shape (n_methylomes, n_intervals). A value of -1.0 means insufficient
+    reads, but by default the minimium required reads is 0.
 
     Parameters
     ----------
@@ -345,7 +374,23 @@ level_container_covered_bindings(
         intervals with no reads will result in a level of 0.0, which might be
         desired depending on your application.
     )doc",
-    "min_reads"_a = 0u);
+          "min_reads"_a = 0u);
+  cls.def("all_wmeans", &transferase::all_wmeans_out<level_container>,
+          R"doc(
+    Like all_wmeans(min_reads), but writes the weighted means into 'out' and
+    returns it, so the same array can be reused across calls.
+
+    Parameters
+    ----------
+
+    min_reads (int): The minimum number of reads below which the value will be
+        given the value -1.0.
+
+    out (numpy.ndarray): A C-contiguous float32 array with shape
+        (n_methylomes, n_intervals). Other arrays are not converted, and
+        raise a TypeError.
+    )doc",
+          "min_reads"_a, "out"_a.noconvert());
   cls
     .def("__str__",
          [](const level_container &self) -> std::string {
@@ -25,7 +25,6 @@ Utilities associated with pyxfr, the Python API for Transferase, but that
 are not implemented within the pyxfr C++ bindings.
 """
 
-import json
 import os
 
 from .pyxfr import GenomeIndex
@@ -51,26 +50,38 @@ def generate_bins(genome_index, bin_size):
 
     bin_size (int): The size of bins to generate.
     """
-    try:
-        index_as_dict = json.loads(str(genome_index))
-    except json.JSONDecodeError as err:
-        raise Exception("Failed to extract metadata from genome index")
-    if not isinstance(index_as_dict, dict) or "meta" not in index_as_dict:
-        raise Exception("Failed to identify 'meta' in genome index")
-    # ADS: if we get here, we assume for now that everything is ok
-    meta = index_as_dict["meta"]
-    chrom_names = [
-        i[-1]
-        for i in sorted([(v, k) for k, v in meta["chrom_index"].items()])
-    ]
-    chrom_sizes = dict(zip(chrom_names, meta["chrom_size"]))
-    for chrom_name, chrom_size in chrom_sizes.items():
-        start = 0
-        stop = 0
-        while start < chrom_size:
-            stop = min(start + bin_size, chrom_size)
-            yield (chrom_name, start, stop)
-            start = stop
+    chrom_sizes = zip(genome_index.chrom_names, genome_index.chrom_sizes)
+    for chrom_name, chrom_size in chrom_sizes:
+        # full bins come from range() and need no min(); then the final
+        # partial bin, if any
+        last_start = chrom_size - chrom_size % bin_size
+        for start in range(0, last_start, bin_size):
+            yield (chrom_name, start, start + bin_size)
+        if last_start < chrom_size:
+            yield (chrom_name, last_start, chrom_size)
+
+
+def generate_bins_array(genome_index, bin_size):
+    """
+    Get the same bins as generate_bins, as numpy arrays rather than one tuple
+    for each bin. Returns a tuple (chrom_names, chrom_ids, starts, stops)
+    where chrom_names is a list of chromosome names, and the other three are
+    arrays with one entry for each bin: chrom_ids (int32) holds the position
+    of the chromosome name in chrom_names, and starts and stops (int64) hold
+    the bin positions.
+
+    Parameters
+    ----------
+
+    genome_index (GenomeIndex): A GenomeIndex object, which defines chromosome
+    names and sizes.
+
+    bin_size (int): The size of bins to generate.
+    """
+    if bin_size <= 0:
+        raise ValueError(f"bin_size must be positive: {bin_size}")
+    chrom_ids, starts, stops = genome_index.get_bins(bin_size)
+    return genome_index.chrom_names, chrom_ids, starts, stops
 
 
 def load_methbase_metadata(genome, config_dir=None):
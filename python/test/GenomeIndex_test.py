@@ -21,30 +21,21 @@
 # SOFTWARE.
 
 import pytest
-import shutil
-import tempfile
 import os
 
 from pyxfr import GenomeIndex
 from pyxfr import GenomicInterval
 
 
-def create_temp_directory():
-    """Create a unique temporary directory in /tmp"""
-    temp_dir = tempfile.mkdtemp(dir="/tmp", prefix="test_")
-    return temp_dir
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def genome_index():
-    """Fixture to create a GenomeIndex object for testing"""
+    """
+    Default constructed GenomeIndex shared by all tests, so they must not
+    modify it
+    """
     return GenomeIndex()
 
 
-def get_rootdir(pytestconfig):
-    return pytestconfig.option["rootdir"]
-
-
 def test_is_consistent(genome_index):
     """Test the 'is_consistent' method"""
     assert isinstance(genome_index.is_consistent(), bool)
@@ -62,80 +53,94 @@ def test_repr(genome_index):
     assert len(repr_str) > 0
 
 
-def test_read(pytestconfig):
+def test_chrom_names_and_sizes(eflareon_index):
+    """Test the 'chrom_names' and 'chrom_sizes' properties"""
+    chrom_names = eflareon_index.chrom_names
+    chrom_sizes = eflareon_index.chrom_sizes
+    assert len(chrom_names) == len(chrom_sizes) == 7
+    assert chrom_names[0] == "chr1"
+    assert chrom_sizes[0] == 956
+
+
+def test_get_bins(eflareon_index):
+    """Test the 'get_bins' method"""
+    bin_size = 100
+    chrom_ids, starts, stops = eflareon_index.get_bins(bin_size)
+    n_bins = len(eflareon_index.get_n_cpgs(bin_size))
+    assert len(chrom_ids) == len(starts) == len(stops) == n_bins
+    assert (starts < stops).all()
+    assert (stops - starts <= bin_size).all()
+
+
+def test_get_bins_largest_bin_size(eflareon_index):
+    """Test 'get_bins' with the largest bin size: one bin per chromosome"""
+    chrom_ids, starts, stops = eflareon_index.get_bins(2**32 - 1)
+    n_chroms = len(eflareon_index.chrom_names)
+    assert list(chrom_ids) == list(range(n_chroms))
+    assert (starts == 0).all()
+    assert list(stops) == list(eflareon_index.chrom_sizes)
+
+
+def test_read(paths):
     """Test the static 'read' method"""
-    rootdir = pytestconfig.rootdir
-    dirname = os.path.join(rootdir, "data/lutions/indexes")
+    dirname = paths.index_dir
     genome_name = "eVaporeon"
     try:
         index = GenomeIndex.read(dirname, genome_name)
     except Exception as err:
-        print(f"CWD={os.getcwd()}\nROOTDIR={pytest.rootdir}")
+        print(f"CWD={os.getcwd()}\nROOTDIR={paths.root}")
         raise err
     assert index is not None
 
 
-def test_write(genome_index):
+def test_write(genome_index, tmp_path):
     """Test the 'write' method"""
-    outdir = create_temp_directory()
     name = "test_name"
-    status = genome_index.write(outdir, name)
+    status = genome_index.write(str(tmp_path), name)
     assert not status
-    if os.path.isdir(outdir):
-        shutil.rmtree(outdir)
 
 
-def test_make_query(genome_index, pytestconfig):
+def test_make_query(genome_index, paths):
     """Test the 'make_query' method"""
-    rootdir = pytestconfig.rootdir
-    intervals_file = os.path.join(
-        rootdir, "data/lutions/raw/eVaporeon_ear_hmr.bed"
-    )
+    intervals_file = os.path.join(paths.raw_dir, "eVaporeon_ear_hmr.bed")
     with pytest.raises(RuntimeError, match="chrom name not found in index"):
         intervals = GenomicInterval.read(genome_index, intervals_file)
         result = genome_index.make_query(intervals)
         assert result is not None  # Modify based on expected output
 
 
-def test_make_genome_index(pytestconfig):
+def test_make_genome_index(paths):
     """Test the static 'make_genome_index' method"""
-    rootdir = pytestconfig.rootdir
-    genome_file = os.path.join(rootdir, "data/lutions/raw/eJolteon.fa.gz")
+    genome_file = os.path.join(paths.raw_dir, "eJolteon.fa.gz")
     result = GenomeIndex.make_genome_index(genome_file)
     assert result is not None
 
 
-def test_files_exist(pytestconfig):
+def test_files_exist(paths, genome_index_listing):
     """Test the static 'files_exist' method"""
-    rootdir = pytestconfig.rootdir
-    directory = os.path.join(rootdir, "data/lutions/indexes")
+    directory = paths.index_dir
     genome_name = "eJolteon"
     result = GenomeIndex.files_exist(directory, genome_name)
     assert isinstance(result, bool)
     assert result
+    assert genome_name in genome_index_listing
 
 
-def test_list_genome_indexes(pytestconfig):
+def test_list_genome_indexes(genome_index_listing):
     """Test the static 'list_genome_indexes' method"""
-    rootdir = pytestconfig.rootdir
-    directory = os.path.join(rootdir, "data/lutions/indexes")
-    result = GenomeIndex.list_genome_indexes(directory)
+    result = genome_index_listing
     assert isinstance(result, list)
     assert len(result) == 3
 
 
-def test_get_n_cpgs_for_intervals(pytestconfig):
+def test_get_n_cpgs_for_intervals(eflareon_index, intervals_loader):
     """
     Test the 'get_n_cpgs' function for GenomeIndex with given list of
     GenomicIntervals objects.
     """
     expected_n_cpgs = [3, 3, 4, 5, 3, 2, 4, 3, 4, 2]
-    rootdir = pytestconfig.rootdir
-    index_directory = os.path.join(rootdir, "data/lutions/indexes")
-    index = GenomeIndex.read(index_directory, "eFlareon")
+    index = eflareon_index
     assert index != None
-    intervals_directory = os.path.join(rootdir, "data", "lutions", "raw")
-    intervals_file = os.path.join(intervals_directory, "eFlareon_brain_hmr.bed")
-    intervals = GenomicInterval.read(index, intervals_file)
+    intervals = intervals_loader("eFlareon", "brain")
     n_cpgs = index.get_n_cpgs(intervals)
     assert n_cpgs == expected_n_cpgs
@@ -21,21 +21,10 @@
 # SOFTWARE.
 
 import pytest
-import shutil
-import tempfile
 import os
 
 
 from pyxfr import GenomicInterval
-from pyxfr import GenomeIndex
-
-
-def create_temp_directory():
-    """
-    Create a unique temporary directory in /tmp
-    """
-    temp_dir = tempfile.mkdtemp(dir="/tmp", prefix="test_")
-    return temp_dir
 
 
 def test_GenomicInterval_init():
@@ -57,43 +46,42 @@ def test_GenomicInterval_repr():
     assert repr(obj) == repr((-1, 0, 0))
 
 
-def test_GenomicInterval_to_string(pytestconfig):
+def test_GenomicInterval_to_string(eflareon_index):
     """
     Test the to_string function for GenomicInterval
     """
-    rootdir = pytestconfig.rootdir
-    index_directory = os.path.join(rootdir, "data/lutions/indexes")
-    index = GenomeIndex.read(index_directory, "eFlareon")
+    index = eflareon_index
     assert index != None
     obj = GenomicInterval()
     obj.ch_id, obj.start, obj.stop = (0, 100, 200)
     assert obj.to_string(index) == repr(("chr1", 100, 200))
 
 
-def test_GenomicInterval_read(pytestconfig):
+def test_GenomicInterval_to_strings(eflareon_index, intervals_loader):
+    """
+    Test the 'to_strings' static function for GenomicInterval
+    """
+    index = eflareon_index
+    intervals = intervals_loader("eFlareon", "brain")
+    strings = GenomicInterval.to_strings(index, intervals)
+    assert strings == [i.to_string(index) for i in intervals]
+
+
+def test_GenomicInterval_read(paths, eflareon_index):
     """
     Test the 'read' function for GenomicInterval
     """
-    rootdir = pytestconfig.rootdir
-    index_directory = os.path.join(rootdir, "data/lutions/indexes")
-    index = GenomeIndex.read(index_directory, "eFlareon")
+    index = eflareon_index
     assert index != None
-    intervals_directory = os.path.join(rootdir, "data/lutions/raw")
-    intervals_file = os.path.join(intervals_directory, "eFlareon_brain_hmr.bed")
+    intervals_file = os.path.join(paths.raw_dir, "eFlareon_brain_hmr.bed")
     obj = GenomicInterval.read(index, intervals_file)
     assert obj != None
     assert len(obj) == 10
 
 
-def test_GenomicInterval_are_valid(pytestconfig):
+def test_GenomicInterval_are_valid(intervals_loader):
     """
     Test the 'are_valid' static function for GenomicInterval
     """
-    rootdir = pytestconfig.rootdir
-    index_directory = os.path.join(rootdir, "data/lutions/indexes")
-    index = GenomeIndex.read(index_directory, "eFlareon")
-    assert index != None
-    intervals_directory = os.path.join(rootdir, "data/lutions/raw")
-    intervals_file = os.path.join(intervals_directory, "eFlareon_brain_hmr.bed")
-    obj = GenomicInterval.read(index, intervals_file)
+    obj = intervals_loader("eFlareon", "brain")
     assert GenomicInterval.are_valid(obj)
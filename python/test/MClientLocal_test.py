@@ -22,72 +22,48 @@
 
 
 import pytest
-import shutil
-import tempfile
 import os
 
 from pyxfr import MClientLocal
 from pyxfr import MConfig
-from pyxfr import GenomicInterval
 from pyxfr import MQuery
-from pyxfr import GenomeIndex
 
 
-def create_temp_directory():
-    """Create a unique temporary directory in /tmp"""
-    temp_dir = tempfile.mkdtemp(dir="/tmp", prefix="test_")
-    return temp_dir
-
-
-def get_config_dir(pytestconfig):
-    """
-    Get the config_dir using the rootdir from pytestconfig
-    """
-    lutions_config_dir = "data/lutions"
-    return os.path.join(pytestconfig.rootdir, lutions_config_dir)
-
-
-def test_MClientLocal_constructor(pytestconfig):
+def test_MClientLocal_constructor(paths):
     """Get a MClientLocal"""
-    obj = MClientLocal(get_config_dir(pytestconfig))
+    obj = MClientLocal(paths.config_dir)
     assert hasattr(obj, "config"), "Object is missing 'config'"
 
 
-def test_reset_to_default_config(pytestconfig):
+def test_reset_to_default_config(local_client):
     """Reset the configuration to the default"""
-    obj = MClientLocal(get_config_dir(pytestconfig))
+    obj = local_client
     obj_tmp = obj
     assert obj_tmp == obj
 
 
-def test_getters(pytestconfig):
+def test_getters(local_client):
     """Test the getter functions"""
-    obj = MClientLocal(get_config_dir(pytestconfig))
+    obj = local_client
     assert os.path.basename(obj.get_index_dir()) == "indexes"
     assert os.path.basename(obj.get_methylome_dir()) == "methylomes"
     assert isinstance(obj.config, MConfig)
 
 
-def test_configured_genomes(pytestconfig):
+def test_configured_genomes(local_client):
     """Test the function to list configured genomes"""
-    obj = MClientLocal(get_config_dir(pytestconfig))
+    obj = local_client
     assert len(obj.configured_genomes()) == 3
 
 
-def test_get_levels(pytestconfig):
+def test_get_levels(intervals_loader, local_client):
     """Test the function to list configured genomes"""
-    rootdir = pytestconfig.rootdir
     methylomes = [
         "eFlareon_brain",
         "eFlareon_tail",
     ]
-    index_directory = os.path.join(rootdir, "data/lutions/indexes")
-    index = GenomeIndex.read(index_directory, "eFlareon")
-    assert index != None
-    intervals_directory = os.path.join(rootdir, "data/lutions/raw")
-    intervals_file = os.path.join(intervals_directory, "eFlareon_brain_hmr.bed")
-    intervals = GenomicInterval.read(index, intervals_file)
-    obj = MClientLocal(get_config_dir(pytestconfig))
+    intervals = intervals_loader("eFlareon", "brain")
+    obj = local_client
     levels = obj.get_levels(methylomes, intervals)
     assert levels.n_rows == len(intervals)
     assert levels.n_cols == len(methylomes)
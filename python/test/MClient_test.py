@@ -22,44 +22,27 @@
 
 
 import pytest
-import shutil
-import tempfile
-import os
 
 from pyxfr import MClient
 
 
-def create_temp_directory():
-    """Create a unique temporary directory in /tmp"""
-    temp_dir = tempfile.mkdtemp(dir="/tmp", prefix="test_")
-    return temp_dir
-
-
-def get_config_dir(pytestconfig):
-    """
-    Get the config_dir using the rootdir from pytestconfig
-    """
-    lutions_config_dir = "data/lutions"
-    return os.path.join(pytestconfig.rootdir, lutions_config_dir)
-
-
-def test_MClient_constructor(pytestconfig):
+def test_MClient_constructor(paths):
     """Get a MClient"""
-    config_dir = get_config_dir(pytestconfig)
+    config_dir = paths.config_dir
     obj = MClient(config_dir)
     assert hasattr(obj, "config"), "Object is missing 'config'"
 
 
-def test_config_makes_sense(pytestconfig):
+def test_config_makes_sense(paths):
     """Check that config object isn't broken"""
-    config_dir = get_config_dir(pytestconfig)
+    config_dir = paths.config_dir
     obj = MClient(config_dir)
     config = obj.config
     assert config.hostname != None
     assert config.port != None
 
 
-def test_configured_genomes(pytestconfig):
+def test_configured_genomes(paths):
     """Test the function to list configured genomes"""
-    obj = MClient(get_config_dir(pytestconfig))
+    obj = MClient(paths.config_dir)
     assert len(obj.configured_genomes()) == 3
@@ -21,22 +21,12 @@
 # SOFTWARE.
 
 import pytest
-import shutil
-import tempfile
 import os
 
 from pyxfr import pyxfr
 from pyxfr import MConfig
 
 
-def create_temp_directory():
-    """
-    Create a unique temporary directory in /tmp
-    """
-    temp_dir = tempfile.mkdtemp(dir="/tmp", prefix="test_")
-    return temp_dir
-
-
 def test_client_config_init():
     """
     Test the factory to get a MConfig with defaults
@@ -45,18 +35,16 @@ def test_client_config_init():
     assert obj is not None
 
 
-def test_assign_and_write_success():
+def test_assign_and_write_success(tmp_path):
     """
     Test that data members of the created object can be assigned to
     and that writing succeeds
     """
     config_filename = f"transferase_client_{pyxfr.__version__}.json"
-    outdir = create_temp_directory()
+    outdir = str(tmp_path)
     obj = MConfig()
     obj.hostname = "not-not-kernel.org"
     obj.config_dir = outdir
     assert obj.save() is None
     assert os.path.exists(outdir)
     assert os.path.exists(os.path.join(outdir, config_filename))
-    if os.path.isdir(outdir):
-        shutil.rmtree(outdir)
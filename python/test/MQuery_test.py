@@ -25,9 +25,12 @@ import pytest
 from pyxfr import MQuery
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def query_containers():
-    """Fixture to set up initial data for tests"""
+    """
+    Fixture to set up initial data for tests; shared by all tests, so they
+    must not modify these objects
+    """
     # Initialize MQuery objects
     query1 = MQuery()
     query2 = MQuery()
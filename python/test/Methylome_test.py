@@ -22,68 +22,48 @@
 
 
 import pytest
-import shutil
-import tempfile
-import os
+import numpy as np
 
-from pyxfr import GenomeIndex
 from pyxfr import Methylome
-from pyxfr import GenomicInterval
 from pyxfr import MLevels
 from pyxfr import MLevelsCovered
 
 
-def get_valid_test_genome_index(genome_name, rootdir):
+def read_test_methylome(paths, genome_name, tissue_name):
     """
-    Fixture to load a valid GenomeIndex object for testing
+    Read a Methylome object that is not shared with other tests, for tests
+    that modify it
     """
-    genome_index_dirname = os.path.join(rootdir, "data/lutions/indexes")
-    genome_index = GenomeIndex.read(genome_index_dirname, genome_name)
-    return genome_index
+    methylome_name = f"{genome_name}_{tissue_name}"
+    return Methylome.read(paths.methylome_dir, methylome_name)
 
 
-def get_valid_test_methylome(genome_name, tissue_name, rootdir):
+def get_valid_test_query(genome_index, intervals):
     """
-    Fixture to load a valid Methylome object for testing
+    Make a valid query for given GenomeIndex and a corresponding list of
+    GenomicInterval objects
     """
-    methylome_directory = os.path.join(rootdir, "data/lutions/methylomes")
-    methylome_name = f"{genome_name}_{tissue_name}"
-    meth = Methylome.read(methylome_directory, methylome_name)
-    return meth
+    query = genome_index.make_query(intervals)
+    assert query is not None, f"Failed to make query from fixture"
+    return query
 
 
-def get_valid_test_genomic_intervals(genome_name, tissue_name, rootdir):
+@pytest.fixture(scope="session")
+def empty_methylome():
     """
-    Fixture to load a valid list of GenomicInterval objects for testing
+    Default constructed Methylome shared by all tests, so they must not
+    modify it
     """
-    intervals_directory = os.path.join(rootdir, "data/lutions/raw")
-    intervals_filename = os.path.join(
-        intervals_directory,
-        f"{genome_name}_{tissue_name}_hmr.bed",
-    )
-    genome_index = get_valid_test_genome_index(genome_name, rootdir)
-    intervals = GenomicInterval.read(genome_index, intervals_filename)
-    return intervals
+    return Methylome()
 
 
-def get_valid_test_query(genome_name, tissue_name, rootdir):
+@pytest.fixture(scope="session")
+def other_empty_methylome():
     """
-    Fixture to make a valid query for given GenomeIndex and a
-    corresponding list of GenomicInterval objects
+    Second default constructed Methylome, for tests that compare two
+    distinct objects; shared, so tests must not modify it
     """
-    intervals = get_valid_test_genomic_intervals(
-        genome_name, tissue_name, rootdir
-    )
-    genome_index = get_valid_test_genome_index(genome_name, rootdir)
-    query = genome_index.make_query(intervals)
-    assert query is not None, f"Failed to make query from fixture"
-    return query
-
-
-def create_temp_directory():
-    """Create a unique temporary directory in /tmp"""
-    temp_dir = tempfile.mkdtemp(dir="/tmp", prefix="test_")
-    return temp_dir
+    return Methylome()
 
 
 def test_methylome_init():
@@ -92,73 +72,67 @@ def test_methylome_init():
     assert obj is not None
 
 
-def test_methylome_read(pytestconfig):
+def test_methylome_read(paths):
     """Test the read static method"""
-    directory = os.path.join(pytestconfig.rootdir, "data/lutions/methylomes")
+    directory = paths.methylome_dir
     methylome_name = "eFlareon_brain"
     meth = Methylome.read(directory, methylome_name)
     assert meth is not None
 
 
-def test_methylome_is_consistent():
+def test_methylome_is_consistent_empty(empty_methylome):
     """Test the is_consistent method (empty Methylome)"""
-    meth = Methylome()
+    meth = empty_methylome
     assert isinstance(meth.is_consistent(), bool)
 
 
-def test_methylome_is_consistent(pytestconfig):
+def test_methylome_is_consistent(methylome_loader):
     """Test the is_consistent method (non-empty Methylome)"""
-    directory = os.path.join(pytestconfig.rootdir, "data/lutions/methylomes")
-    methylome_name = "eFlareon_brain"
-    meth = Methylome.read(directory, methylome_name)
+    meth = methylome_loader("eFlareon", "brain")
     assert meth.is_consistent()
 
 
-def test_methylome_is_consistent_with_other():
+def test_methylome_is_consistent_with_other(
+    empty_methylome, other_empty_methylome
+):
     """Test the is_consistent method (with another methylome object)"""
-    obj1 = Methylome()
-    obj2 = Methylome()
+    obj1 = empty_methylome
+    obj2 = other_empty_methylome
     assert isinstance(obj1.is_consistent(obj2), bool)
 
 
-def test_methylome_write(pytestconfig):
+def test_methylome_write(methylome_loader, tmp_path):
     """Test the write method"""
-    rootdir = pytestconfig.rootdir
     genome_name = "eVaporeon"
     tissue_name = "brain"
     methylome_name = f"{genome_name}_{tissue_name}"
-    meth = get_valid_test_methylome(genome_name, tissue_name, rootdir)
-    output_directory = create_temp_directory()
-    meth.write(output_directory, methylome_name)
-    if os.path.isdir(output_directory):
-        shutil.rmtree(output_directory)
+    meth = methylome_loader(genome_name, tissue_name)
+    meth.write(str(tmp_path), methylome_name)
 
 
-def test_methylome_init_metadata_inconsistent(pytestconfig):
+def test_methylome_init_metadata_inconsistent(paths, genome_index_loader):
     """
     Test init_metadata method when Methylome and GenomeIndex are not
     consistent
     """
-    rootdir = pytestconfig.rootdir
     genome_name1 = "eVaporeon"
     genome_name2 = "eJolteon"
     tissue_name = "ear"
-    index = get_valid_test_genome_index(genome_name1, rootdir)
-    meth = get_valid_test_methylome(genome_name2, tissue_name, rootdir)
+    index = genome_index_loader(genome_name1)
+    meth = read_test_methylome(paths, genome_name2, tissue_name)
     with pytest.raises(RuntimeError, match="invalid methylome data"):
         meth.init_metadata(index)
 
 
-def test_methylome_init_metadata_consistent(pytestconfig):
+def test_methylome_init_metadata_consistent(paths, genome_index_loader):
     """
     Test init_metadata method when Methylome and GenomeIndex are
     consistent
     """
-    rootdir = pytestconfig.rootdir
     genome_name = "eFlareon"
     tissue_name = "tail"
-    index = get_valid_test_genome_index(genome_name, rootdir)
-    meth = get_valid_test_methylome(genome_name, tissue_name, rootdir)
+    index = genome_index_loader(genome_name)
+    meth = read_test_methylome(paths, genome_name, tissue_name)
     try:
         meth.init_metadata(index)
     except RuntimeError as run_err:
@@ -174,91 +148,142 @@ def test_methylome_update_metadata_empty():
         pytest.fail(f"Unexpected exception raised: {run_err}")
 
 
-def test_methylome_update_metadata(pytestconfig):
+def test_methylome_update_metadata(paths):
     """Test update_metadata method"""
-    rootdir = pytestconfig.rootdir
     genome_name = "eVaporeon"
     tissue_name = "brain"
-    meth = get_valid_test_methylome("eVaporeon", "brain", rootdir)
+    meth = read_test_methylome(paths, genome_name, tissue_name)
     try:
         meth.update_metadata()
     except RuntimeError as run_err:
         pytest.fail(f"Unexpected exception raised: {run_err}")
 
 
-def test_methylome_add_empty(pytestconfig):
+def test_methylome_add_empty(paths, methylome_loader):
     """Test add method for two empty methylomes"""
-    rootdir = pytestconfig.rootdir
-    meth1 = get_valid_test_methylome("eJolteon", "brain", rootdir)
-    meth2 = get_valid_test_methylome("eJolteon", "ear", rootdir)
+    meth1 = read_test_methylome(paths, "eJolteon", "brain")
+    meth2 = methylome_loader("eJolteon", "ear")
     meth1.add(meth2)
     assert meth1 is not None
 
 
-def test_methylome_repr():
+def test_methylome_repr(empty_methylome):
     """Test __repr__ method"""
-    meth = Methylome()
+    meth = empty_methylome
     repr_result = repr(meth)
     assert isinstance(repr_result, str)
     assert "version" in repr_result
 
 
-def test_methylome_get_levels_with_query_container(pytestconfig):
+# Genome and tissue pairs for the get_levels tests, grouped by genome so the
+# session loaders read each GenomeIndex once and reuse it
+GENOME_TISSUE = [
+    ("eFlareon", "brain"),
+    ("eJolteon", "ear"),
+    ("eVaporeon", "brain"),
+]
+
+
+def genome_tissue_id(pair):
+    return "_".join(pair)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("names", GENOME_TISSUE, ids=genome_tissue_id)
+def test_methylome_get_levels_with_query_container(
+    names, genome_index_loader, methylome_loader, intervals_loader
+):
     """Test get_levels method (with query_container argument)"""
-    rootdir = pytestconfig.rootdir
-    meth = get_valid_test_methylome("eFlareon", "brain", rootdir)
-    query = get_valid_test_query("eFlareon", "brain", rootdir)
+    genome_name, tissue_name = names
+    meth = methylome_loader(genome_name, tissue_name)
+    genome_index = genome_index_loader(genome_name)
+    intervals = intervals_loader(genome_name, tissue_name)
+    query = get_valid_test_query(genome_index, intervals)
     levels = meth.get_levels(query)
     assert isinstance(levels, MLevels)
 
 
-def test_methylome_get_levels_covered_with_query_container(pytestconfig):
+@pytest.mark.slow
+@pytest.mark.parametrize("names", GENOME_TISSUE, ids=genome_tissue_id)
+def test_methylome_get_levels_covered_with_query_container(
+    names, genome_index_loader, methylome_loader, intervals_loader
+):
     """Test get_levels_covered method (with query_container argument)"""
-    rootdir = pytestconfig.rootdir
-    meth = get_valid_test_methylome("eJolteon", "ear", rootdir)
-    query = get_valid_test_query("eJolteon", "ear", rootdir)
+    genome_name, tissue_name = names
+    meth = methylome_loader(genome_name, tissue_name)
+    genome_index = genome_index_loader(genome_name)
+    intervals = intervals_loader(genome_name, tissue_name)
+    query = get_valid_test_query(genome_index, intervals)
     levels = meth.get_levels_covered(query)
     assert isinstance(levels, MLevelsCovered)
 
 
-def test_methylome_get_levels_with_bin_size_and_genome_index(pytestconfig):
+@pytest.mark.slow
+@pytest.mark.parametrize("names", GENOME_TISSUE, ids=genome_tissue_id)
+def test_methylome_get_levels_with_bin_size_and_genome_index(
+    names, genome_index_loader, methylome_loader
+):
     """Test get_levels method (with bin_size and genome_index argument)"""
-    rootdir = pytestconfig.rootdir
-    genome_name = "eJolteon"
-    tissue_name = "ear"
-    meth = get_valid_test_methylome(genome_name, tissue_name, rootdir)
-    genome_index = get_valid_test_genome_index(genome_name, rootdir)
+    genome_name, tissue_name = names
+    meth = methylome_loader(genome_name, tissue_name)
+    genome_index = genome_index_loader(genome_name)
     bin_size = 100
     levels = meth.get_levels(bin_size, genome_index)
     assert isinstance(levels, MLevels)
 
 
+@pytest.mark.slow
+@pytest.mark.parametrize("names", GENOME_TISSUE, ids=genome_tissue_id)
 def test_methylome_get_levels_covered_with_bin_size_and_genome_index(
-    pytestconfig,
+    names, genome_index_loader, methylome_loader
 ):
     """Test get_levels_covered method (with bin_size and genome_index argument)"""
-    rootdir = pytestconfig.rootdir
-    genome_name = "eJolteon"
-    tissue_name = "ear"
-    meth = get_valid_test_methylome(genome_name, tissue_name, rootdir)
-    genome_index = get_valid_test_genome_index(genome_name, rootdir)
+    genome_name, tissue_name = names
+    meth = methylome_loader(genome_name, tissue_name)
+    genome_index = genome_index_loader(genome_name)
     bin_size = 100
     levels = meth.get_levels_covered(bin_size, genome_index)
     assert isinstance(levels, MLevelsCovered)
 
 
-def test_methylome_global_levels():
+@pytest.mark.slow
+def test_methylome_all_wmeans(genome_index_loader, methylome_loader):
+    """Test all_wmeans method, with and without an output array"""
+    genome_name = "eJolteon"
+    tissue_name = "ear"
+    meth = methylome_loader(genome_name, tissue_name)
+    genome_index = genome_index_loader(genome_name)
+    levels = meth.get_levels(100, genome_index)
+    min_reads = 2
+    means = levels.all_wmeans(min_reads)
+    assert means.shape == (levels.n_methylomes, levels.n_intervals)
+    out = np.empty(means.shape, dtype=np.float32)
+    result = levels.all_wmeans(min_reads, out=out)
+    assert np.array_equal(out, means)
+    assert np.array_equal(result, means)
+    with pytest.raises(ValueError):
+        levels.all_wmeans(min_reads, out=np.empty((1, 1), dtype=np.float32))
+    # arrays that would need converting are rejected, not copied
+    with pytest.raises(TypeError):
+        levels.all_wmeans(min_reads, out=np.empty(means.shape))
+    n_rows, n_cols = means.shape
+    strided = np.empty((n_rows, 2 * n_cols), dtype=np.float32)[:, ::2]
+    with pytest.raises(TypeError):
+        levels.all_wmeans(min_reads, out=strided)
+
+
+def test_methylome_global_levels(empty_methylome):
     """Test global_levels method"""
-    meth = Methylome()
+    meth = empty_methylome
     result = meth.global_levels()
     assert isinstance(result, tuple), "result should be a tuple"
     assert len(result) == 2, "result should have 2 elements"
     assert result[0] == 0
 
 
-def test_methylome_global_levels_covered():
+def test_methylome_global_levels_covered(empty_methylome):
     """Test global_levels_covered method"""
-    meth = Methylome()
+    meth = empty_methylome
     result = meth.global_levels_covered()
     assert isinstance(result, tuple), "result should be a tuple"
     assert len(result) == 3, "result should have 3 elements"
@@ -0,0 +1,122 @@
+# MIT License
+#
+# Copyright (c) 2025 Andrew D Smith
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pytest
+import functools
+import os
+import types
+
+# pyxfr is imported within the fixtures that use it, so that collecting or
+# deselecting tests does not load the extension module through this file
+
+
+def pytest_configure(config):
+    """Register the markers used by the tests"""
+    config.addinivalue_line(
+        "markers", "slow: computes levels over whole methylomes"
+    )
+
+
+@pytest.fixture(scope="session")
+def paths(pytestconfig):
+    """Directories within the test data, constructed once for the session"""
+    root = str(pytestconfig.rootdir)
+    return types.SimpleNamespace(
+        root=root,
+        config_dir=os.path.join(root, "data/lutions"),
+        index_dir=os.path.join(root, "data/lutions/indexes"),
+        raw_dir=os.path.join(root, "data/lutions/raw"),
+        methylome_dir=os.path.join(root, "data/lutions/methylomes"),
+    )
+
+
+@pytest.fixture(scope="session")
+def genome_index_listing(paths):
+    """Names of the genome indexes in the test data, listed once"""
+    from pyxfr import GenomeIndex
+
+    return GenomeIndex.list_genome_indexes(paths.index_dir)
+
+
+@pytest.fixture(scope="session")
+def genome_index_loader(paths):
+    """
+    Function to get a GenomeIndex by genome name; each is read once for the
+    session, so tests must not modify them
+    """
+    from pyxfr import GenomeIndex
+
+    @functools.lru_cache(maxsize=None)
+    def load(genome_name):
+        return GenomeIndex.read(paths.index_dir, genome_name)
+
+    return load
+
+
+@pytest.fixture(scope="session")
+def methylome_loader(paths):
+    """
+    Function to get a Methylome by genome and tissue name; each is read once
+    for the session, so tests must not modify them
+    """
+    from pyxfr import Methylome
+
+    @functools.lru_cache(maxsize=None)
+    def load(genome_name, tissue_name):
+        methylome_name = f"{genome_name}_{tissue_name}"
+        return Methylome.read(paths.methylome_dir, methylome_name)
+
+    return load
+
+
+@pytest.fixture(scope="session")
+def intervals_loader(paths, genome_index_loader):
+    """
+    Function to get the list of GenomicInterval objects for the HMRs of a
+    genome and tissue; each BED file is read once for the session, so tests
+    must not modify the lists
+    """
+    from pyxfr import GenomicInterval
+
+    @functools.lru_cache(maxsize=None)
+    def load(genome_name, tissue_name):
+        intervals_filename = os.path.join(
+            paths.raw_dir, f"{genome_name}_{tissue_name}_hmr.bed"
+        )
+        genome_index = genome_index_loader(genome_name)
+        return GenomicInterval.read(genome_index, intervals_filename)
+
+    return load
+
+
+@pytest.fixture(scope="session")
+def eflareon_index(genome_index_loader):
+    """GenomeIndex for eFlareon, read once for the session"""
+    return genome_index_loader("eFlareon")
+
+
+@pytest.fixture(scope="session")
+def local_client(paths):
+    """MClientLocal using the test config, constructed once for the session"""
+    from pyxfr import MClientLocal
+
+    return MClientLocal(paths.config_dir)
@@ -33,46 +33,63 @@ bin_size = 100000
 window_size = 30000
 window_step = 10000
 
-# Set the log level to debug to see all
+def format_rows(labels, arr):
+    """
+    Format levels from an nparray view as one line per label, each with the
+    levels for all methylomes, so a block is printed with a single write
+    """
+    lines = []
+    for i, label in enumerate(labels):
+        cells = map(str, map(tuple, arr[:, i].tolist()))
+        lines.append("\t".join([label, *cells]))
+    return "\n".join(lines)
+
+# Set the log level; use TRANSFERASE_LOG_LEVEL=debug to see all
+import os
 import pyxfr
-pyxfr.set_log_level("debug")
+pyxfr.set_log_level(os.environ.get("TRANSFERASE_LOG_LEVEL", "warning"))
 
-# Do the config
+# Do the config, unless the genome index is already installed
 from pyxfr import MConfig
+from pyxfr import GenomeIndex
 config = MConfig()
-config.install([genome_name])
+# The index_dir is relative to the config_dir, as in MClient.get_index_dir
+index_dir = os.path.join(config.config_dir, config.index_dir)
+if not GenomeIndex.files_exist(index_dir, genome_name):
+    config.install([genome_name])
 
 # Get a client
 from pyxfr import MClient
 client = MClient()
 
 # Load the genome index
-from pyxfr import GenomeIndex
 genome_index = GenomeIndex.read(client.get_index_dir(), genome_name)
 
 # Read the genomic intervals for the query
 from pyxfr import GenomicInterval
 intervals = GenomicInterval.read(genome_index, intervals_filename)
 
+# Format the intervals that are printed below in one call
+interval_strings = GenomicInterval.to_strings(genome_index, intervals[:10])
+
 # Do the query using the intervals
 levels = client.get_levels(genome_name, methylome_names, intervals)
 
+# The nparray view is indexed by methylome, then interval: arr[j, i] holds
+# the same values as levels.at(i, j) without a call for each element
 print("levels:")
-print("\n".join([str(levels.at(i, 1)) for i in range(10)]))
+arr = levels.view_nparray()
+print("\n".join(map(str, map(tuple, arr[1, :10].tolist()))))
 print()
 
 query = genome_index.make_query(intervals)
 levels = client.get_levels_covered(genome_name, methylome_names, query)
 
 print("levels covered (with intervals):")
-for i in range(10):
-    print(intervals[i].to_string(genome_index), end="\t")
-    for j in range(levels.n_methylomes):
-        print(levels.at(i, j), end="\t")
-    print()
+arr = levels.view_nparray()
+print(format_rows(interval_strings, arr))
 print()
 
-arr = levels.view_nparray()
 print("levels as nparray:")
 print(arr[0:10])
 print()
@@ -103,19 +120,13 @@ print()
 
 print("levels in bins:")
 levels_bins = client.get_levels(genome_name, methylome_names, bin_size)
-for i in range(10):
-    print(intervals[i].to_string(genome_index), end="\t")
-    for j in range(levels_bins.n_methylomes):
-        print(levels_bins.at(i, j), end='\t')
-    print()
+arr = levels_bins.view_nparray()
+print(format_rows(interval_strings, arr))
 print()
 
 print("levels in windows:")
 levels_windows = client.get_levels(genome_name, methylome_names,
                                    window_size, window_step)
-for i in range(10):
-    print(intervals[i].to_string(genome_index), end="\t")
-    for j in range(levels_windows.n_methylomes):
-        print(levels_windows.at(i, j), end='\t')
-    print()
+arr = levels_windows.view_nparray()
+print(format_rows(interval_strings, arr))
 print()
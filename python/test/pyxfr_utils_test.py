@@ -0,0 +1,64 @@
+# MIT License
+#
+# Copyright (c) 2025 Andrew D Smith
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import pytest
+import subprocess
+import sys
+
+from pyxfr import generate_bins
+from pyxfr import generate_bins_array
+
+
+def test_generate_bins_array(eflareon_index):
+    """Test that generate_bins_array gives the bins of generate_bins"""
+    bin_size = 1000
+    chrom_names, chrom_ids, starts, stops = generate_bins_array(
+        eflareon_index, bin_size
+    )
+    assert len(chrom_ids) == len(starts) == len(stops)
+    bins = [
+        (chrom_names[i], start, stop)
+        for i, start, stop in zip(
+            chrom_ids.tolist(), starts.tolist(), stops.tolist()
+        )
+    ]
+    assert bins == list(generate_bins(eflareon_index, bin_size))
+
+
+def test_generate_bins_array_bad_bin_size(eflareon_index):
+    """Test that generate_bins_array rejects a bin size that is not positive"""
+    with pytest.raises(ValueError):
+        generate_bins_array(eflareon_index, 0)
+
+
+def test_package_submodule_attributes():
+    """
+    Test that the submodules are attributes of the package before they are
+    imported; this needs a new interpreter, as the tests already import them
+    """
+    code = (
+        "import pyxfr; "
+        "assert pyxfr.pyxfr_utils.generate_bins is pyxfr.generate_bins; "
+        "assert pyxfr.pyxfr.GenomeIndex is pyxfr.GenomeIndex"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)